@@ -1,9 +1,172 @@
-import requests
+import argparse
+import asyncio
+import functools
+import hashlib
+import os
+import random
 import re
+import string
+import sys
+import unicodedata
+from difflib import SequenceMatcher
+from urllib.parse import quote, urlencode
+
+import httpx
+import orjson
+
+REQUEST_TIMEOUT = 10.0
+# A mailto in the User-Agent puts requests in Crossref's "polite" pool
+USER_AGENT = "dtcc-check-bib/1.0 (mailto:your-email@example.com)"
+# Transient failures (connection errors, timeouts, throttling and gateway errors)
+# are retried with jittered exponential backoff instead of failing the reference
+MAX_ATTEMPTS = 5
+BACKOFF_INITIAL = 0.5
+BACKOFF_MAX = 30.0
+# Longest Retry-After honoured; an exhausted Scopus quota can ask for hours
+MAX_RATE_LIMIT_WAIT = 120.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Per-host concurrency limits: Crossref asks clients to stay polite and
+# Scopus enforces a per-key quota, so requests are shaped into a steady stream.
+CROSSREF_SEM = asyncio.Semaphore(10)
+SCOPUS_SEM = asyncio.Semaphore(3)
+
+# Lookup results are kept between runs, since bibliographies rarely change.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "dtcc-bib")
+
+# ----------------------------
+# 0. HTTP HELPERS AND LOOKUP CACHE
+# ----------------------------
+def create_session():
+    """
+    Create the HTTP/2 client shared by all lookups. Concurrent requests to the same
+    host are multiplexed over one connection, so each host pays the TCP/TLS handshake only once.
+    """
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    return httpx.AsyncClient(http2=True, timeout=REQUEST_TIMEOUT, limits=limits,
+                             headers={"User-Agent": USER_AGENT})
+
+def retry_delay(retry_after, attempt):
+    """
+    Seconds to wait before the next attempt. Uses the server's Retry-After header
+    when it holds a number of seconds (capped at MAX_RATE_LIMIT_WAIT), otherwise
+    exponential backoff with full jitter, so that concurrent lookups failing together
+    do not all retry at the same moment.
+    """
+    try:
+        return min(max(float(retry_after), 0.0), MAX_RATE_LIMIT_WAIT)
+    except (TypeError, ValueError):
+        return random.uniform(0.0, min(BACKOFF_MAX, BACKOFF_INITIAL * 2.0 ** attempt))
+
+async def fetch_json(session, semaphore, url, **kwargs):
+    """
+    GET a JSON document while holding a slot of the given per-host semaphore.
+    Returns None if the resource does not exist (HTTP 404).
+    Transport errors and RETRY_STATUSES responses are retried up to MAX_ATTEMPTS times,
+    honouring Retry-After; after that the error is raised.
+    The slot is released while backing off, so one throttled lookup cannot hold up
+    every other request to the same host.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        last_attempt = attempt == MAX_ATTEMPTS - 1
+        try:
+            async with semaphore:
+                response = await session.get(url, **kwargs)
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+            await asyncio.sleep(retry_delay(None, attempt))
+            continue
+        if response.status_code == 404:
+            return None
+        if response.status_code not in RETRY_STATUSES or last_attempt:
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        await asyncio.sleep(retry_delay(response.headers.get("Retry-After"), attempt))
+
+# Failures of a single lookup: HTTP and transport errors, and bodies that are not JSON
+LOOKUP_ERRORS = (httpx.HTTPError, orjson.JSONDecodeError)
+
+def cache_key(ref_dict):
+    """Stable key identifying a parsed reference in the lookup caches."""
+    if ref_dict.get("doi"):
+        text = f"doi:{ref_dict['doi'].lower()}"
+    else:
+        text = f"{ref_dict['title_norm']}|{ref_dict['journal_norm']}|{ref_dict['year']}"
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def load_cache(name):
+    """Load a named lookup cache from CACHE_DIR, or start empty if missing or unreadable."""
+    path = os.path.join(CACHE_DIR, f"{name}.json")
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(name, cache):
+    """Write a named lookup cache atomically so an interrupted run never corrupts it."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, f"{name}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(cache))
+    os.replace(tmp_path, path)
 
 # ----------------------------
 # 1. PARSE REFERENCES
 # ----------------------------
+# Regex patterns (very naive, might fail on complex references)
+_YEAR_PAGES_RE = re.compile(r"\((?P<year>\d{4})\)|, (?P<pages>\d+(?:-\d+)?)\.")
+_PARENS_RE = re.compile(r"\(\d+\)")
+_DOI_RE = re.compile(r"\b10\.\d{4,9}/[-._;()/:A-Z0-9]+", re.IGNORECASE)
+_PUNCTUATION_TO_SPACE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+def normalize_text(text):
+    """
+    Canonical form of a title or journal name used for queries, cache keys and
+    duplicate detection: accents folded to ASCII, punctuation replaced by spaces
+    and whitespace collapsed.
+    """
+    folded = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return " ".join(folded.translate(_PUNCTUATION_TO_SPACE).split())
+
+def iter_references(path):
+    """Yield the references in a text file, one per non-empty line."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield line.strip()
+
+def _split_title_and_source(ref_text, start):
+    """
+    Walk the text once from `start` and split it into (title, source).
+    The title ends at the first ".", "?" or "!" followed by whitespace, except for
+    periods closing a single-capital initial (e.g. "U. S."), which APA titles and
+    author lists are full of. Unlike splitting on every period, this needs no
+    intermediate list and does not stop at initials.
+    """
+    n = len(ref_text)
+    i = start
+    # Skip the period and whitespace closing the "(YEAR)" element
+    while i < n and (ref_text[i] == "." or ref_text[i].isspace()):
+        i += 1
+    title_start = i
+    while i < n:
+        ch = ref_text[i]
+        if ch in ".?!" and (i + 1 == n or ref_text[i + 1].isspace()):
+            is_initial = (ch == "." and ref_text[i - 1].isupper()
+                          and (i - 1 == title_start or not ref_text[i - 2].isalpha()))
+            if not is_initial:
+                # Keep "?" and "!" as part of the title, drop the period
+                title_end = i if ch == "." else i + 1
+                return ref_text[title_start:title_end].strip(), ref_text[i + 1:].strip()
+        i += 1
+    return ref_text[title_start:].strip().rstrip("."), ""
+
+# Bound on memoized parses, so long runs over huge bibliographies cannot grow it without limit
+PARSE_CACHE_SIZE = 65536
+
 def parse_reference(ref_text):
     """
     Attempts to parse an APA-like reference and extract:
@@ -12,159 +175,505 @@ def parse_reference(ref_text):
     - Journal (or source)
     - Volume
     - Page range
+    - DOI (if the reference contains one)
     
     This function uses simple regex heuristics that may fail for more complex references.
     Adjust or improve if your references have a different or more complicated format.
+    Parses are memoized, so repeated reference texts are only parsed once.
     """
-    # Regex patterns (very naive, might fail on complex references)
-    year_pattern = r"\((\d{4})\)"
-    pages_pattern = r", (\d+(?:-\d+)?)\."
-    
-    # Try capturing the year
-    year_match = re.search(year_pattern, ref_text)
-    year = year_match.group(1) if year_match else None
-    
-    # Try capturing pages
-    pages_match = re.search(pages_pattern, ref_text)
-    pages = pages_match.group(1) if pages_match else None
-    
-    # Split by period to get segments, then guess the title segment
-    # This is simplistic—actual references can be more complicated.
-    parts = [p.strip() for p in ref_text.split(".")]
+    year, title, title_norm, journal, journal_norm, pages, doi = _parse_reference_fields(ref_text)
+    parsed_ref = {
+        "original_text": ref_text,
+        "year": year,
+        "title": title,
+        "title_norm": title_norm,
+        "journal": journal,
+        "journal_norm": journal_norm,
+        "pages": pages,
+        "doi": doi
+    }
+    return parsed_ref
+
+def _clean_doi(doi):
+    """
+    Strip what the DOI pattern picks up from the surrounding text: trailing
+    punctuation such as the reference's closing period, and closing parentheses
+    that belong to an enclosing "(doi:...)" rather than to the DOI itself.
+    """
+    while doi:
+        if doi[-1] in ".,;:":
+            doi = doi[:-1]
+        elif doi[-1] == ")" and doi.count(")") > doi.count("("):
+            doi = doi[:-1]
+        else:
+            break
+    return doi or None
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_reference_fields(ref_text):
+    """
+    Parse a reference into an immutable (year, title, title_norm, journal,
+    journal_norm, pages, doi) tuple, which is safe to share between cache hits.
+    """
+    # Capture the first year and the first page range in a single scan
+    year = None
+    year_end = 0
+    pages = None
+    for match in _YEAR_PAGES_RE.finditer(ref_text):
+        if year is None and match.group("year"):
+            year = match.group("year")
+            year_end = match.end()
+        elif pages is None and match.group("pages"):
+            pages = match.group("pages")
+        if year is not None and pages is not None:
+            break
     
-    # The second segment in typical APA references often contains the article title
+    # In APA references the title follows "(YEAR)." and is followed by the source
     # Example: "Aliabadi, A. A., ... (2018). Effects of roof-edge roughness on air temperature..."
-    # We'll do a naive guess for the title.
-    # If there's no second segment, fallback to entire string
-    title = parts[1] if len(parts) > 1 else ref_text
-    
-    # The last part might contain the journal info
-    # Example: "Boundary-Layer Meteorology, 164(2), 249-279"
-    # We'll guess the last part is the "journal info"
-    journal_info = parts[-1] if len(parts) > 1 else ""
+    # If there's no year, the title is guessed from the start of the text.
+    title, source = _split_title_and_source(ref_text, year_end)
     
     # We can try to separate the journal name from volume/issue
-    # For instance: "Boundary-Layer Meteorology, 164(2), 249-279"
+    # For instance: "Boundary-Layer Meteorology, 164(2), 249-279."
     # We'll split by comma, first part is the journal, then volume/issue, etc.
-    journal_parts = journal_info.split(",")
-    journal = journal_parts[0].strip() if journal_parts else journal_info
+    journal = source.split(",")[0].strip().rstrip(".")
     
     # Attempt to remove leftover parentheses from the journal name
-    journal = re.sub(r"\(\d+\)", "", journal).strip()
+    journal = _PARENS_RE.sub("", journal).strip()
     
-    parsed_ref = {
-        "original_text": ref_text,
-        "year": year,
-        "title": title,
-        "journal": journal,
-        "pages": pages
-    }
-    return parsed_ref
+    # A DOI identifies the work exactly, so keep it for a direct lookup.
+    doi_match = _DOI_RE.search(ref_text)
+    doi = _clean_doi(doi_match.group(0)) if doi_match else None
+    
+    return year, title, normalize_text(title), journal, normalize_text(journal), pages, doi
 
 # ----------------------------
 # 2. CHECK VIA CROSSREF
 # ----------------------------
-def check_crossref(ref_dict):
+CROSSREF_URL = "https://api.crossref.org/works"
+# The fixed part of the search URL is encoded once; only the query text varies
+# per reference. We'll just ask for the top match.
+CROSSREF_SEARCH_URL = f"{CROSSREF_URL}?{urlencode({'rows': 1})}&query.bibliographic="
+# DOIs looked up per request via an OR-ed doi: filter
+CROSSREF_BATCH_SIZE = 50
+
+def crossref_summary(item):
+    """Summarize a Crossref work record in the shape returned by check_crossref."""
+    return {
+        "found": True,
+        "doi": item.get("DOI"),
+        "title": item.get("title", [""])[0] if item.get("title") else "",
+        "year": item.get("published-print", {}).get("date-parts", [[None]])[0][0],
+        "publisher": item.get("publisher")
+    }
+
+async def check_crossref(session, ref_dict, cache=None):
     """
     Query Crossref using the article's title (and possibly other fields) to see if there's a match.
     Returns a dictionary with some info about the match or None if not found.
+    Completed lookups are stored in `cache` (if given) and reused on later calls.
+    References with a DOI are better served by check_crossref_batch.
     """
-    base_url = "https://api.crossref.org/works"
+    key = cache_key(ref_dict)
+    if cache is not None and key in cache:
+        return cache[key]
+    
     # Build a query string. Here we’re using title + journal + year to increase chances of a match.
-    query_str = f"{ref_dict['title']} {ref_dict['journal']} {ref_dict['year']}"
-
-    params = {
-        "query.bibliographic": query_str,
-        "rows": 1  # we'll just ask for the top match
-    }
+    query_str = " ".join(filter(None, (ref_dict["title_norm"], ref_dict["journal_norm"], ref_dict["year"])))
     
     try:
-        response = requests.get(base_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = await fetch_json(session, CROSSREF_SEM, CROSSREF_SEARCH_URL + quote(query_str))
         
-        if data["message"]["items"]:
-            top_match = data["message"]["items"][0]
-            return {
-                "found": True,
-                "doi": top_match.get("DOI"),
-                "title": top_match.get("title", [""])[0] if top_match.get("title") else "",
-                "year": top_match.get("published-print", {}).get("date-parts", [[None]])[0][0],
-                "publisher": top_match.get("publisher")
-            }
-    except requests.RequestException as e:
+        items = data["message"]["items"] if data else []
+        
+        result = {"found": False}
+        if items:
+            result = crossref_summary(items[0])
+        if cache is not None:
+            cache[key] = result
+        return result
+    except LOOKUP_ERRORS as e:
         print(f"Crossref request failed for: {ref_dict['title']}. Error: {e}")
     return {"found": False}
 
+async def check_crossref_batch(session, refs, cache=None):
+    """
+    Query Crossref for references that have a DOI. Up to CROSSREF_BATCH_SIZE DOIs are
+    combined into one `filter=doi:...,doi:...` request and the returned works are matched
+    back to the references by DOI, so each batch costs one round-trip instead of one per reference.
+    Returns a list of results in the same order as `refs`.
+    """
+    results = [None] * len(refs)
+    pending = []
+    for i, ref_dict in enumerate(refs):
+        key = cache_key(ref_dict)
+        if cache is not None and key in cache:
+            results[i] = cache[key]
+        else:
+            pending.append(i)
+    
+    async def check_chunk(indices):
+        params = {
+            "filter": ",".join(f"doi:{refs[i]['doi']}" for i in indices),
+            "rows": len(indices)
+        }
+        try:
+            data = await fetch_json(session, CROSSREF_SEM, CROSSREF_URL, params=params)
+        except LOOKUP_ERRORS as e:
+            print(f"Crossref batch request failed for {len(indices)} DOIs. Error: {e}")
+            for i in indices:
+                results[i] = {"found": False}
+            return
+        
+        matches = {}
+        for item in data["message"]["items"] if data else []:
+            if item.get("DOI"):
+                matches[item["DOI"].lower()] = crossref_summary(item)
+        for i in indices:
+            results[i] = matches.get(refs[i]["doi"].lower(), {"found": False})
+            if cache is not None:
+                cache[cache_key(refs[i])] = results[i]
+    
+    await asyncio.gather(*(
+        check_chunk(pending[start:start + CROSSREF_BATCH_SIZE])
+        for start in range(0, len(pending), CROSSREF_BATCH_SIZE)
+    ))
+    return results
+
 # ----------------------------
 # 3. CHECK VIA SCOPUS (requires valid API key or library)
 # ----------------------------
-def check_scopus(ref_dict, api_key):
+SCOPUS_URL = "https://api.elsevier.com/content/search/scopus"
+# Per-reference searches grab just one result
+SCOPUS_SEARCH_URL = f"{SCOPUS_URL}?{urlencode({'count': 1})}&query="
+# Scopus accepts at most 25 OR-joined terms in one search
+SCOPUS_BATCH_SIZE = 25
+
+def scopus_headers(api_key):
+    """Request headers for the Scopus Search API."""
+    return {
+        "X-ELS-APIKey": api_key,
+        "Accept": "application/json"
+    }
+
+def scopus_summary(entry):
+    """Summarize a Scopus search entry in the shape returned by check_scopus."""
+    return {
+        "found": True,
+        "scopus_id": entry.get("dc:identifier"),
+        "title": entry.get("dc:title"),
+        "publication_name": entry.get("prism:publicationName")
+    }
+
+async def check_scopus(session, ref_dict, api_key, cache=None):
     """
     Query Scopus with the article's title and/or other fields.
     This is an example using the 'Author Search' endpoint, but you might need a different endpoint.
+    Completed lookups are stored in `cache` (if given) and reused on later calls.
     
     IMPORTANT: You need a valid Scopus API key. Some libraries like 'pybliometrics' can handle
     authentication and queries for you. This function shows a direct request approach.
     """
-    # This is an example for demonstration only. Adjust the endpoint and parameters as needed.
-    base_url = "https://api.elsevier.com/content/search/scopus"
-    
-    # Searching by article title and year, for instance:
-    query_str = f"TITLE({ref_dict['title']}) AND PUBYEAR IS {ref_dict['year']}"
-    
-    headers = {
-        "X-ELS-APIKey": api_key,
-        "Accept": "application/json"
-    }
+    key = cache_key(ref_dict)
+    if cache is not None and key in cache:
+        return cache[key]
     
-    params = {
-        "query": query_str,
-        "count": 1  # grab just one result
-    }
+    # This is an example for demonstration only. Adjust the endpoint and parameters as needed.
+    # Searching by article title and year, for instance. The normalized title has
+    # no parentheses, which would otherwise break the TITLE(...) syntax.
+    query_str = f"TITLE({ref_dict['title_norm']})"
+    if ref_dict["year"]:
+        query_str += f" AND PUBYEAR IS {ref_dict['year']}"
     
     try:
-        response = requests.get(base_url, headers=headers, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        entries = data.get("search-results", {}).get("entry", [])
+        data = await fetch_json(session, SCOPUS_SEM, SCOPUS_SEARCH_URL + quote(query_str), headers=scopus_headers(api_key))
+        entries = data.get("search-results", {}).get("entry", []) if data else []
         
+        result = {"found": False}
         if entries:
-            entry = entries[0]
-            return {
-                "found": True,
-                "scopus_id": entry.get("dc:identifier"),
-                "title": entry.get("dc:title"),
-                "publication_name": entry.get("prism:publicationName")
-            }
-    except requests.RequestException as e:
+            result = scopus_summary(entries[0])
+        if cache is not None:
+            cache[key] = result
+        return result
+    except LOOKUP_ERRORS as e:
         print(f"Scopus request failed for: {ref_dict['title']}. Error: {e}")
     return {"found": False}
 
+async def check_scopus_batch(session, refs, api_key, cache=None):
+    """
+    Query Scopus for references that have a DOI. Up to SCOPUS_BATCH_SIZE DOIs are
+    OR-joined into a single search and the returned entries are matched back to
+    the references by DOI, so each batch costs one request instead of one per reference.
+    Returns a list of results in the same order as `refs`.
+    """
+    results = [None] * len(refs)
+    pending = []
+    for i, ref_dict in enumerate(refs):
+        key = cache_key(ref_dict)
+        if cache is not None and key in cache:
+            results[i] = cache[key]
+        else:
+            pending.append(i)
+    
+    async def check_chunk(indices):
+        # DOIs may contain parentheses, so each one is quoted to keep the query valid
+        query_str = " OR ".join(f'DOI("{refs[i]["doi"]}")' for i in indices)
+        params = {
+            "query": query_str,
+            "count": len(indices)
+        }
+        try:
+            data = await fetch_json(session, SCOPUS_SEM, SCOPUS_URL, headers=scopus_headers(api_key), params=params)
+        except LOOKUP_ERRORS as e:
+            print(f"Scopus batch request failed for {len(indices)} DOIs. Error: {e}")
+            for i in indices:
+                results[i] = {"found": False}
+            return
+        
+        # Entries without a DOI include the "Result set was empty" placeholder
+        matches = {}
+        for entry in data.get("search-results", {}).get("entry", []) if data else []:
+            if entry.get("prism:doi"):
+                matches[entry["prism:doi"].lower()] = scopus_summary(entry)
+        for i in indices:
+            results[i] = matches.get(refs[i]["doi"].lower(), {"found": False})
+            if cache is not None:
+                cache[cache_key(refs[i])] = results[i]
+    
+    await asyncio.gather(*(
+        check_chunk(pending[start:start + SCOPUS_BATCH_SIZE])
+        for start in range(0, len(pending), SCOPUS_BATCH_SIZE)
+    ))
+    return results
+
 # ----------------------------
-# 4. MAIN SCRIPT
+# 4. CHECKING PIPELINE
 # ----------------------------
-if __name__ == "__main__":
-    # Example references list. Replace with file reading if you prefer.
-    reference_texts = [
-        "Aliabadi, A. A., Krayenhoff, E. S., Nazarian, N., Chew, L. W., Armstrong, P. R., Afshari, A., & Norford, L. K. (2018). Effects of roof-edge roughness on air temperature and pollutant concentration in urban canyons. Boundary-Layer Meteorology, 164(2), 249-279.",
-        "Amorim, J. H., Valente, J., Cascão, P., Rodrigues, V., Pimentel, C., Miranda, A. I., & Borrego, C. (2013). Pedestrian exposure to air pollution in cities: Modeling the effect of roadside trees. Advances in Meteorology, 2013, 1-7.",
-        # ... (add more references as needed)
+# References waiting to be checked, and results waiting to be printed
+QUEUE_SIZE = 256
+N_WORKERS = 8
+# References handed to a worker at a time; one Crossref batch, two Scopus batches
+BATCH_SIZE = CROSSREF_BATCH_SIZE
+
+# Title similarity above which a Crossref match is trusted without asking Scopus
+SCOPUS_SKIP_SIMILARITY = 0.85
+
+def title_similarity(a, b):
+    """Similarity ratio in [0, 1] of two titles, ignoring case, accents and punctuation."""
+    return SequenceMatcher(None, normalize_text(a).lower(), normalize_text(b).lower()).ratio()
+
+def confident_crossref_match(parsed, crossref_result):
+    """
+    True if the Crossref result already settles that the reference exists: either it
+    was found by its exact DOI, or the matched title is close enough to the parsed one.
+    """
+    if isinstance(crossref_result, Exception) or not crossref_result.get("found"):
+        return False
+    if parsed["doi"]:
+        return True
+    return title_similarity(crossref_result["title"], parsed["title_norm"]) > SCOPUS_SKIP_SIMILARITY
+
+async def check_by_doi_or_title(parsed_refs, indices, check_batch, check_one):
+    """
+    Run `check_batch` on the references in `indices` that have a DOI and `check_one` on
+    each of the rest, concurrently. Returns {index: result}; failed title lookups map to
+    their exception.
+    """
+    doi_indices = [i for i in indices if parsed_refs[i]["doi"]]
+    title_indices = [i for i in indices if not parsed_refs[i]["doi"]]
+    doi_results, title_results = await asyncio.gather(
+        check_batch([parsed_refs[i] for i in doi_indices]),
+        asyncio.gather(*(check_one(parsed_refs[i]) for i in title_indices), return_exceptions=True),
+    )
+    return dict(zip(doi_indices + title_indices, doi_results + title_results))
+
+async def check_references(session, parsed_refs, api_key, crossref_cache=None, scopus_cache=None):
+    """
+    Check parsed references against Crossref, then ask Scopus only about the ones Crossref
+    could not confidently confirm. Within each step all lookups run concurrently.
+    Returns a list of (crossref_result, scopus_result) pairs in the same order as `parsed_refs`.
+    """
+    # References with a DOI are checked in batches; the rest need a title search each.
+    # The lookups are pure network I/O, so issue all of them at once and
+    # wait for the slowest one instead of paying every round-trip in sequence.
+    crossref_results = await check_by_doi_or_title(
+        parsed_refs, range(len(parsed_refs)),
+        lambda refs: check_crossref_batch(session, refs, crossref_cache),
+        lambda parsed: check_crossref(session, parsed, crossref_cache),
+    )
+    
+    unconfirmed = [
+        i for i, parsed in enumerate(parsed_refs)
+        if not confident_crossref_match(parsed, crossref_results[i])
     ]
+    scopus_results = await check_by_doi_or_title(
+        parsed_refs, unconfirmed,
+        lambda refs: check_scopus_batch(session, refs, api_key, scopus_cache),
+        lambda parsed: check_scopus(session, parsed, api_key, scopus_cache),
+    )
+    
+    results = []
+    for i in range(len(parsed_refs)):
+        crossref_result = crossref_results[i]
+        scopus_result = scopus_results.get(i, {"skipped": "confident Crossref match"})
+        results.append(tuple(
+            {"found": False, "error": str(r)} if isinstance(r, Exception) else r
+            for r in (crossref_result, scopus_result)
+        ))
+    return results
+
+def reference_key(parsed):
+    """
+    Key under which two parsed references count as the same work: the DOI if there
+    is one, otherwise the normalized title and journal (ignoring case), year and pages.
+    """
+    if parsed["doi"]:
+        return parsed["doi"].lower()
+    return (parsed["title_norm"].lower(), parsed["journal_norm"].lower(), parsed["year"], parsed["pages"])
+
+async def produce(reference_texts, work_queue, output_queue):
+    """
+    Parse references as they are read and queue them for checking. Every reference
+    gets a future for its result, which is also queued (in input order) for printing.
+    Repeated references share the future of their first occurrence and are only checked once;
+    that future is kept for the whole run, one per unique reference.
+    """
+    loop = asyncio.get_running_loop()
+    seen = {}
+    for ref_text in reference_texts:
+        parsed = parse_reference(ref_text)
+        key = reference_key(parsed)
+        future = seen.get(key)
+        if future is None:
+            future = seen[key] = loop.create_future()
+            await work_queue.put((parsed, future))
+        await output_queue.put((parsed, future))
+    for _ in range(N_WORKERS):
+        await work_queue.put(None)
+    await output_queue.put(None)
+
+async def consume(session, work_queue, api_key, crossref_cache=None, scopus_cache=None):
+    """
+    Take up to BATCH_SIZE queued references at a time, check them and resolve their futures.
+    Stops when it takes the end-of-input marker (None) off the queue.
+    """
+    done = False
+    while not done:
+        item = await work_queue.get()
+        if item is None:
+            break
+        batch = [item]
+        while len(batch) < BATCH_SIZE:
+            try:
+                item = work_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is None:
+                done = True
+                break
+            batch.append(item)
+        
+        try:
+            results = await check_references(
+                session, [parsed for parsed, _ in batch], api_key, crossref_cache, scopus_cache
+            )
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+def format_result(parsed, crossref_result, scopus_result):
+    """Human-readable report for one reference."""
+    return (
+        f"Original Reference: {parsed['original_text']}\n"
+        f"Parsed Data: {parsed}\n"
+        f"Crossref Result: {crossref_result}\n"
+        f"Scopus Result: {scopus_result}\n"
+        f"{'-' * 80}\n"
+    )
+
+def format_result_jsonl(parsed, crossref_result, scopus_result):
+    """Machine-readable record for one reference, as one line of JSON."""
+    record = {"ref": parsed, "crossref": crossref_result, "scopus": scopus_result}
+    return orjson.dumps(record).decode("utf-8") + "\n"
+
+async def write_results(output_queue, out=sys.stdout, formatter=format_result):
+    """
+    Write results in input order as soon as each one is available. Reports are
+    collected in a buffer that is written out in one call whenever the next result
+    still has to be waited for, instead of issuing several writes per reference.
+    """
+    out_buf = []
+    while True:
+        item = await output_queue.get()
+        if item is None:
+            break
+        parsed, future = item
+        if not future.done() and out_buf:
+            out.write("".join(out_buf))
+            out_buf.clear()
+        try:
+            crossref_result, scopus_result = await future
+        except Exception as e:
+            crossref_result = scopus_result = {"found": False, "error": str(e)}
+        out_buf.append(formatter(parsed, crossref_result, scopus_result))
+    out.write("".join(out_buf))
+    out.flush()
+
+# ----------------------------
+# 5. MAIN SCRIPT
+# ----------------------------
+# Checked when no references file is given
+EXAMPLE_REFERENCES = [
+    "Aliabadi, A. A., Krayenhoff, E. S., Nazarian, N., Chew, L. W., Armstrong, P. R., Afshari, A., & Norford, L. K. (2018). Effects of roof-edge roughness on air temperature and pollutant concentration in urban canyons. Boundary-Layer Meteorology, 164(2), 249-279.",
+    "Amorim, J. H., Valente, J., Cascão, P., Rodrigues, V., Pimentel, C., Miranda, A. I., & Borrego, C. (2013). Pedestrian exposure to air pollution in cities: Modeling the effect of roadside trees. Advances in Meteorology, 2013, 1-7.",
+]
+
+async def main():
+    parser = argparse.ArgumentParser(description="Check references against Crossref and Scopus")
+    parser.add_argument("references", nargs="?",
+                        help="Text file with one reference per line (default: built-in examples)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Ignore and do not update the lookup cache in {CACHE_DIR}")
+    parser.add_argument("--jsonl", metavar="FILE",
+                        help="Write one JSON record per reference to FILE instead of a report to stdout")
+    args = parser.parse_args()
     
     # Insert your Scopus API key here if you're testing Scopus lookups:
     SCOPUS_API_KEY = "YOUR_SCOPUS_API_KEY"
     
-    for ref in reference_texts:
-        parsed = parse_reference(ref)
-        
-        # Crossref check
-        crossref_result = check_crossref(parsed)
-        # Scopus check
-        scopus_result = check_scopus(parsed, SCOPUS_API_KEY)
-        
-        print("Original Reference:", parsed["original_text"])
-        print("Parsed Data:", parsed)
-        print("Crossref Result:", crossref_result)
-        print("Scopus Result:", scopus_result)
-        print("-" * 80)
+    crossref_cache = None if args.no_cache else load_cache("crossref")
+    scopus_cache = None if args.no_cache else load_cache("scopus")
+    
+    reference_texts = iter_references(args.references) if args.references else EXAMPLE_REFERENCES
+    
+    # Stream references through a bounded queue so the first lookups start while the
+    # file is still being read. Duplicate detection keeps one result per unique
+    # reference, so memory still grows with the number of distinct references.
+    work_queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    output_queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    out = open(args.jsonl, "w", encoding="utf-8") if args.jsonl else sys.stdout
+    formatter = format_result_jsonl if args.jsonl else format_result
+    try:
+        async with create_session() as session:
+            workers = [
+                consume(session, work_queue, SCOPUS_API_KEY, crossref_cache, scopus_cache)
+                for _ in range(N_WORKERS)
+            ]
+            await asyncio.gather(
+                produce(reference_texts, work_queue, output_queue),
+                write_results(output_queue, out, formatter),
+                *workers,
+            )
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    
+    if not args.no_cache:
+        save_cache("crossref", crossref_cache)
+        save_cache("scopus", scopus_cache)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,14 +10,22 @@ It queries multiple scholarly databases and consolidates the results.
 """
 
 import argparse
-import json
+import functools
+import os
 import time
 import re
+import string
 import sys
-from dataclasses import dataclass
+import unicodedata
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Set, Optional, Any
 from datetime import datetime
+from difflib import SequenceMatcher
+from itertools import count
 
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -25,7 +33,7 @@ from urllib3.util.retry import Retry
 
 # ----- Data Classes -----
 
-@dataclass
+@dataclass(slots=True)
 class Publication:
     """Class for storing publication information"""
     title: str
@@ -43,31 +51,121 @@ class Publication:
     type: Optional[str] = None
     source: str = ""  # Which database provided this info
     
+    # Comparison keys, normalized once at construction (not part of the output)
+    _doi_key: Optional[str] = field(init=False, default=None, repr=False, compare=False)
+    _title_key: str = field(init=False, default="", repr=False, compare=False)
+    # Set once every field that merging can fill in has a value
+    _complete: bool = field(init=False, default=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._doi_key = normalize_doi(self.doi)
+        self._title_key = normalize_title(self.title)
+    
     def __hash__(self):
         # Use DOI for hash if available, otherwise use title+year
-        if self.doi:
-            return hash(self.doi.lower())
-        return hash((self.title.lower(), self.year))
+        if self._doi_key:
+            return hash(self._doi_key)
+        return hash((self._title_key, self.year))
     
     def __eq__(self, other):
         if not isinstance(other, Publication):
             return False
-        if self.doi and other.doi:
-            return self.doi.lower() == other.doi.lower()
-        return self.title.lower() == other.title.lower() and self.year == other.year
+        if self._doi_key and other._doi_key:
+            return self._doi_key == other._doi_key
+        return self._title_key == other._title_key and self.year == other.year
 
 
 # ----- HTTP Client -----
 
+# Keep-alive pool sizing: one pool per API host, and enough connections per host
+# for every worker thread that may be talking to it at the same time
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 16
+
+# Never wait longer than this for a server-announced rate limit window
+MAX_RATE_LIMIT_WAIT = 120.0
+
+
+def rate_limit_reset_delay(headers):
+    """
+    Seconds until the rate limit window announced by X-RateLimit-Reset resets
+    
+    The header is either a Unix timestamp (Elsevier) or a number of seconds.
+    Returns None if the header is missing or malformed.
+    """
+    reset = headers.get("X-RateLimit-Reset")
+    if reset is None:
+        return None
+    try:
+        reset = float(reset)
+    except ValueError:
+        return None
+    # Values this large are epoch timestamps rather than durations
+    if reset > 1e9:
+        reset -= time.time()
+    return min(max(reset, 0.0), MAX_RATE_LIMIT_WAIT)
+
+
+class RateLimitRetry(Retry):
+    """
+    Retry policy that waits as long as the server asks instead of guessing
+    
+    Retry-After is honored first; when it is absent, an exhausted
+    X-RateLimit-Remaining with an X-RateLimit-Reset schedules the retry for the
+    start of the next window. Otherwise the exponential backoff applies.
+    """
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, MAX_RATE_LIMIT_WAIT)
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            return rate_limit_reset_delay(response.headers)
+        return None
+
+
+def wait_for_rate_limit(response, min_remaining=2):
+    """Sleep until the rate limit window resets if the remaining quota is nearly exhausted"""
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    try:
+        if remaining is None or int(remaining) >= min_remaining:
+            return
+    except ValueError:
+        return
+    delay = rate_limit_reset_delay(response.headers)
+    if delay:
+        print(f"Rate limit nearly exhausted, waiting {delay:.1f}s for reset...", file=sys.stderr)
+        time.sleep(delay)
+
+
+def decode_json(response):
+    """
+    Decode a JSON response body with orjson
+    
+    Malformed bodies raise InvalidJSONError, a RequestException, so the callers'
+    existing error handling covers them just as it did for response.json().
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.InvalidJSONError(
+            f"Invalid JSON response from {response.url}: {e}", response=response
+        ) from e
+
+
 def create_session():
-    """Create a requests session with retry capabilities"""
+    """Create a requests session with retry capabilities and a shared connection pool"""
     session = requests.Session()
-    retries = Retry(
+    retries = RateLimitRetry(
         total=5,
         backoff_factor=0.5,
         status_forcelist=[429, 500, 502, 503, 504],
     )
-    adapter = HTTPAdapter(max_retries=retries)
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retries
+    )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     # Set a user agent to be polite to APIs
@@ -79,15 +177,61 @@ def create_session():
 
 # ----- ORCID API -----
 
+# Profiles are cached on disk for a day; set PROFILE_CACHE_DIR to None to disable
+PROFILE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "dtcc-authors", "orcid")
+PROFILE_CACHE_TTL = 24 * 60 * 60
+
+
+def load_cached_profile(orcid):
+    """Load an ORCID profile from the disk cache if present and not expired"""
+    if PROFILE_CACHE_DIR is None:
+        return None
+    path = os.path.join(PROFILE_CACHE_DIR, f"{orcid}.json")
+    try:
+        if time.time() - os.path.getmtime(path) > PROFILE_CACHE_TTL:
+            return None
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_profile(orcid, profile):
+    """Write an ORCID profile to the disk cache atomically"""
+    if PROFILE_CACHE_DIR is None:
+        return
+    try:
+        os.makedirs(PROFILE_CACHE_DIR, exist_ok=True)
+        path = os.path.join(PROFILE_CACHE_DIR, f"{orcid}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(profile))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not cache ORCID profile: {e}", file=sys.stderr)
+
+
+@functools.lru_cache(maxsize=128)
 def get_orcid_profile(session, orcid):
-    """Retrieve basic profile information from ORCID"""
+    """
+    Retrieve basic profile information from ORCID
+    
+    Several providers need the author's name, so the profile is memoized per
+    run and kept in a short-lived disk cache across runs.
+    """
+    profile = load_cached_profile(orcid)
+    if profile is not None:
+        return profile
+    
     url = f"https://pub.orcid.org/v3.0/{orcid}"
     headers = {"Accept": "application/json"}
     
     try:
         response = session.get(url, headers=headers)
         response.raise_for_status()
-        return response.json()
+        profile = decode_json(response)
+        save_cached_profile(orcid, profile)
+        return profile
     except requests.exceptions.RequestException as e:
         print(f"Error retrieving ORCID profile: {e}", file=sys.stderr)
         return None
@@ -101,7 +245,7 @@ def get_orcid_works(session, orcid):
     try:
         response = session.get(url, headers=headers)
         response.raise_for_status()
-        data = response.json()
+        data = decode_json(response)
         
         publications = []
         for group in data.get("group", []):
@@ -145,81 +289,131 @@ def get_orcid_works(session, orcid):
 
 # ----- Crossref API -----
 
-def get_crossref_publications(session, orcid):
-    """Retrieve publications from Crossref using ORCID"""
-    url = f"https://api.crossref.org/works?filter=orcid:{orcid}&rows=1000"
+_ORCID_ID_RE = re.compile(r"(\d{4}-\d{4}-\d{4}-\d{3}[\dXx])$")
+
+
+def parse_crossref_item(item):
+    """Build a Publication from one Crossref work item"""
+    # Get title
+    title = "Unknown Title"
+    if "title" in item and item["title"]:
+        title = item["title"][0]
+
+    # Get authors
+    authors = []
+    for author in item.get("author", []):
+        name_parts = []
+        if "given" in author:
+            name_parts.append(author["given"])
+        if "family" in author:
+            name_parts.append(author["family"])
+        if name_parts:
+            authors.append(" ".join(name_parts))
+
+    # Get year
+    year = None
+    if "published" in item and "date-parts" in item["published"]:
+        date_parts = item["published"]["date-parts"]
+        if date_parts and date_parts[0]:
+            year = date_parts[0][0]
+
+    # Get journal/container
+    journal = None
+    if "container-title" in item and item["container-title"]:
+        journal = item["container-title"][0]
+
+    # Get DOI
+    doi = item.get("DOI")
+
+    # Get other metadata
+    volume = item.get("volume")
+    issue = item.get("issue")
+    pages = item.get("page")
+    publisher = item.get("publisher")
+    url = item.get("URL")
+
+    # Create publication object
+    pub = Publication(
+        title=title,
+        authors=authors,
+        year=year,
+        doi=doi,
+        journal=journal,
+        volume=volume,
+        issue=issue,
+        pages=pages,
+        publisher=publisher,
+        url=url,
+        source="Crossref"
+    )
+    return pub
+
+
+def get_crossref_publications_batch(session, orcids):
+    """
+    Retrieve publications from Crossref for several ORCIDs with a single query
+    
+    Crossref ORs repeated filters of the same name, so the whole group is paged
+    through once instead of once per person. Works are then assigned to every
+    requested ORCID listed among their authors. Returns a dict keyed by ORCID.
+    
+    A failure midway returns the pages already collected for a single ORCID,
+    but an empty dict for a group, so that callers fall back to querying each
+    ORCID on its own rather than keeping a partial result for all of them.
+    """
+    base_url = "https://api.crossref.org/works"
+    rows = 500
+    cursor = "*"
+    publications = {orcid: [] for orcid in orcids}
+    orcid_filter = ",".join(f"orcid:{orcid}" for orcid in orcids)
     
     try:
-        response = session.get(url)
-        response.raise_for_status()
-        data = response.json()
-        
-        publications = []
-        for item in data.get("message", {}).get("items", []):
-            # Get title
-            title = "Unknown Title"
-            if "title" in item and item["title"]:
-                title = item["title"][0]
+        while cursor:
+            params = {"filter": orcid_filter, "rows": rows, "cursor": cursor}
+            response = session.get(base_url, params=params)
+            response.raise_for_status()
+            message = decode_json(response).get("message", {})
+            items = message.get("items", [])
             
-            # Get authors
-            authors = []
-            for author in item.get("author", []):
-                name_parts = []
-                if "given" in author:
-                    name_parts.append(author["given"])
-                if "family" in author:
-                    name_parts.append(author["family"])
-                if name_parts:
-                    authors.append(" ".join(name_parts))
-            
-            # Get year
-            year = None
-            if "published" in item and "date-parts" in item["published"]:
-                date_parts = item["published"]["date-parts"]
-                if date_parts and date_parts[0]:
-                    year = date_parts[0][0]
-            
-            # Get journal/container
-            journal = None
-            if "container-title" in item and item["container-title"]:
-                journal = item["container-title"][0]
-            
-            # Get DOI
-            doi = item.get("DOI")
-            
-            # Get other metadata
-            volume = item.get("volume")
-            issue = item.get("issue")
-            pages = item.get("page")
-            publisher = item.get("publisher")
-            url = item.get("URL")
+            for item in items:
+                pub = parse_crossref_item(item)
+                if len(orcids) == 1:
+                    publications[orcids[0]].append(pub)
+                    continue
+                
+                # Crossref reports author ORCIDs as URLs (http://orcid.org/XXXX-...).
+                # Each author gets its own copy, as merging updates records in place.
+                for author in item.get("author", []):
+                    match = _ORCID_ID_RE.search(author.get("ORCID", ""))
+                    if match and match.group(1).upper() in publications:
+                        publications[match.group(1).upper()].append(replace(pub))
             
-            # Create publication object
-            pub = Publication(
-                title=title,
-                authors=authors,
-                year=year,
-                doi=doi,
-                journal=journal,
-                volume=volume,
-                issue=issue,
-                pages=pages,
-                publisher=publisher,
-                url=url,
-                source="Crossref"
-            )
-            publications.append(pub)
+            # A short page means the cursor is exhausted
+            if len(items) < rows:
+                break
+            cursor = message.get("next-cursor")
         
         return publications
     except requests.exceptions.RequestException as e:
         print(f"Error retrieving Crossref publications: {e}", file=sys.stderr)
-        return []
+        return publications if len(orcids) == 1 else {}
+
+
+def get_crossref_publications(session, orcid):
+    """Retrieve publications from Crossref using ORCID, following the deep-paging cursor"""
+    return get_crossref_publications_batch(session, [orcid]).get(orcid, [])
 
 
 # ----- Semantic Scholar API -----
 
-def get_semantic_scholar_profile(session, orcid):
-    """Retrieve author profile from Semantic Scholar using ORCID"""
+def get_semantic_scholar_profile(session, orcid, orcid_profile=None):
+    """
+    Retrieve author profile from Semantic Scholar using ORCID
+    
+    orcid_profile is the ORCID profile, or a Future resolving to it, used for
+    the name search fallback; it is fetched on demand if not given. A Future
+    is only waited on when the fallback is actually needed.
+    """
     url = f"https://api.semanticscholar.org/graph/v1/author/orcid:{orcid}"
     params = {
         "fields": "name,aliases,affiliations,homepage,paperCount,citationCount,hIndex"
@@ -235,7 +429,10 @@ def get_semantic_scholar_profile(session, orcid):
             print("Trying alternative lookup methods...", file=sys.stderr)
             
             # Get name from ORCID profile and try to search by name
-            orcid_profile = get_orcid_profile(session, orcid)
+            if orcid_profile is None:
+                orcid_profile = get_orcid_profile(session, orcid)
+            elif isinstance(orcid_profile, Future):
+                orcid_profile = orcid_profile.result()
             if orcid_profile:
                 first_name = orcid_profile.get("person", {}).get("name", {}).get("given-names", {}).get("value", "")
                 last_name = orcid_profile.get("person", {}).get("name", {}).get("family-name", {}).get("value", "")
@@ -252,7 +449,7 @@ def get_semantic_scholar_profile(session, orcid):
                     try:
                         search_response = session.get(search_url, params=search_params)
                         search_response.raise_for_status()
-                        search_data = search_response.json()
+                        search_data = decode_json(search_response)
                         
                         # If we found any matches
                         if search_data.get("data") and len(search_data["data"]) > 0:
@@ -267,7 +464,7 @@ def get_semantic_scholar_profile(session, orcid):
         
         # For other errors, raise exception
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
     except requests.exceptions.RequestException as e:
         if "404" in str(e):
             print(f"Author with ORCID {orcid} not found in Semantic Scholar.", file=sys.stderr)
@@ -278,149 +475,186 @@ def get_semantic_scholar_profile(session, orcid):
 
 
 def get_semantic_scholar_publications(session, author_id):
-    """Retrieve publications from Semantic Scholar using author ID"""
+    """
+    Retrieve publications from Semantic Scholar using author ID
+    
+    Papers are requested in pages of bounded size, so prolific authors are not
+    truncated and no single response has to be held in memory at once.
+    """
     if not author_id:
         return []
     
     url = f"https://api.semanticscholar.org/graph/v1/author/{author_id}/papers"
-    params = {
-        "fields": "title,authors,year,venue,publicationVenue,journal,volume,issue,pages,externalIds,url,abstract,citationCount",
-        "limit": 1000
-    }
+    limit = 500
+    offset = 0
+    publications = []
     
     try:
-        response = session.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        publications = []
-        for paper in data.get("data", []):
-            # Get authors
-            authors = [author.get("name", "") for author in paper.get("authors", [])]
+        while offset is not None:
+            params = {
+                "fields": "title,authors,year,venue,publicationVenue,journal,volume,issue,pages,externalIds,url,abstract,citationCount",
+                "limit": limit,
+                "offset": offset
+            }
+            response = session.get(url, params=params)
+            response.raise_for_status()
+            data = decode_json(response)
             
-            # Get DOI
-            doi = None
-            if "externalIds" in paper and "DOI" in paper["externalIds"]:
-                doi = paper["externalIds"]["DOI"]
+            for paper in data.get("data", []):
+                # Get authors
+                authors = [author.get("name", "") for author in paper.get("authors", [])]
             
-            # Get venue/journal
-            journal = None
-            if "venue" in paper and paper["venue"]:
-                journal = paper["venue"]
-            elif "journal" in paper and paper["journal"]:
-                journal = paper["journal"]["name"]
+                # Get DOI
+                doi = None
+                if "externalIds" in paper and "DOI" in paper["externalIds"]:
+                    doi = paper["externalIds"]["DOI"]
             
-            # Create publication object
-            pub = Publication(
-                title=paper.get("title", "Unknown Title"),
-                authors=authors,
-                year=paper.get("year"),
-                doi=doi,
-                journal=journal,
-                volume=paper.get("volume"),
-                issue=paper.get("issue"),
-                pages=paper.get("pages"),
-                url=paper.get("url"),
-                abstract=paper.get("abstract"),
-                citations=paper.get("citationCount"),
-                source="Semantic Scholar"
-            )
-            publications.append(pub)
+                # Get venue/journal
+                journal = None
+                if "venue" in paper and paper["venue"]:
+                    journal = paper["venue"]
+                elif "journal" in paper and paper["journal"]:
+                    journal = paper["journal"]["name"]
+            
+                # Create publication object
+                pub = Publication(
+                    title=paper.get("title", "Unknown Title"),
+                    authors=authors,
+                    year=paper.get("year"),
+                    doi=doi,
+                    journal=journal,
+                    volume=paper.get("volume"),
+                    issue=paper.get("issue"),
+                    pages=paper.get("pages"),
+                    url=paper.get("url"),
+                    abstract=paper.get("abstract"),
+                    citations=paper.get("citationCount"),
+                    source="Semantic Scholar"
+                )
+                publications.append(pub)
+            
+            # "next" is only present while more papers remain
+            offset = data.get("next")
         
         return publications
     except requests.exceptions.RequestException as e:
         print(f"Error retrieving Semantic Scholar publications: {e}", file=sys.stderr)
-        return []
+        return publications
+
+
+def get_semantic_scholar_works(session, orcid, orcid_profile=None):
+    """
+    Retrieve publications from Semantic Scholar using ORCID.
+    Returns None if the author is not found in Semantic Scholar.
+    """
+    profile = get_semantic_scholar_profile(session, orcid, orcid_profile)
+    author_id = profile.get("authorId") if profile else None
+    if not author_id:
+        return None
+    return get_semantic_scholar_publications(session, author_id)
 
 
 # ----- OpenAlex API -----
 
 def get_openalex_publications(session, orcid):
-    """Retrieve publications from OpenAlex using ORCID"""
-    url = f"https://api.openalex.org/works?filter=author.orcid:{orcid}"
-    params = {
-        "per_page": 200
-    }
+    """Retrieve publications from OpenAlex using ORCID, following the result cursor"""
+    url = "https://api.openalex.org/works"
+    per_page = 200
+    cursor = "*"
+    publications = []
     
     try:
-        response = session.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
-        publications = []
-        for item in data.get("results", []):
-            # Get title
-            title = item.get("title", "Unknown Title")
+        while cursor:
+            params = {
+                "filter": f"author.orcid:{orcid}",
+                "per_page": per_page,
+                "cursor": cursor
+            }
+            response = session.get(url, params=params)
+            response.raise_for_status()
+            data = decode_json(response)
+            results = data.get("results", [])
             
-            # Get authors
-            authors = []
-            for author in item.get("authorships", []):
-                if "author" in author and "display_name" in author["author"]:
-                    authors.append(author["author"]["display_name"])
+            for item in results:
+                # Get title
+                title = item.get("title", "Unknown Title")
             
-            # Get year
-            year = None
-            if "publication_year" in item:
-                year = item["publication_year"]
+                # Get authors
+                authors = []
+                for author in item.get("authorships", []):
+                    if "author" in author and "display_name" in author["author"]:
+                        authors.append(author["author"]["display_name"])
             
-            # Get DOI
-            doi = None
-            if "doi" in item and item["doi"] is not None:
-                doi = item["doi"].replace("https://doi.org/", "")
+                # Get year
+                year = None
+                if "publication_year" in item:
+                    year = item["publication_year"]
             
-            # Get journal
-            journal = None
-            if "primary_location" in item and item["primary_location"] is not None:
-                if "source" in item["primary_location"] and item["primary_location"]["source"] is not None:
-                    journal = item["primary_location"]["source"].get("display_name")
+                # Get DOI
+                doi = None
+                if "doi" in item and item["doi"] is not None:
+                    doi = item["doi"].removeprefix("https://doi.org/")
             
-            # Get abstract
-            abstract = None
-            if "abstract_inverted_index" in item:
-                # OpenAlex uses an inverted index for abstracts, need to reconstruct
-                inv_index = item["abstract_inverted_index"]
-                if inv_index:
-                    words = list(inv_index.keys())
-                    positions = []
-                    for word, pos_list in inv_index.items():
-                        for pos in pos_list:
-                            positions.append((pos, word))
-                    positions.sort()
-                    abstract = " ".join([p[1] for p in positions])
+                # Get journal
+                journal = None
+                if "primary_location" in item and item["primary_location"] is not None:
+                    if "source" in item["primary_location"] and item["primary_location"]["source"] is not None:
+                        journal = item["primary_location"]["source"].get("display_name")
             
-            # Get citations
-            citations = item.get("cited_by_count")
+                # Get abstract
+                abstract = None
+                if "abstract_inverted_index" in item:
+                    # OpenAlex uses an inverted index for abstracts, need to reconstruct
+                    inv_index = item["abstract_inverted_index"]
+                    if inv_index:
+                        # Positions are dense word offsets, so place each word
+                        # directly instead of sorting (position, word) pairs
+                        length = max((pos for pos_list in inv_index.values() for pos in pos_list), default=-1) + 1
+                        words = [""] * length
+                        for word, pos_list in inv_index.items():
+                            for pos in pos_list:
+                                words[pos] = word
+                        abstract = " ".join(words)
             
-            # Create publication object
-            pub = Publication(
-                title=title,
-                authors=authors,
-                year=year,
-                doi=doi,
-                journal=journal,
-                abstract=abstract,
-                citations=citations,
-                url=item.get("primary_location", {}).get("landing_page_url"),
-                source="OpenAlex"
-            )
-            publications.append(pub)
+                # Get citations
+                citations = item.get("cited_by_count")
+            
+                # Create publication object
+                pub = Publication(
+                    title=title,
+                    authors=authors,
+                    year=year,
+                    doi=doi,
+                    journal=journal,
+                    abstract=abstract,
+                    citations=citations,
+                    url=item.get("primary_location", {}).get("landing_page_url"),
+                    source="OpenAlex"
+                )
+                publications.append(pub)
+            
+            if len(results) < per_page:
+                break
+            cursor = data.get("meta", {}).get("next_cursor")
         
         return publications
     except requests.exceptions.RequestException as e:
         print(f"Error retrieving OpenAlex publications: {e}", file=sys.stderr)
-        return []
+        return publications
 
 
 # ----- arXiv API -----
 
-def get_arxiv_publications(session, orcid):
+def get_arxiv_publications(session, orcid, profile=None):
     """
     Retrieve publications from arXiv
     
     Note: arXiv doesn't directly support ORCID search, 
     so we need to use author name from ORCID profile
+    (passed in if already retrieved, fetched otherwise)
     """
-    profile = get_orcid_profile(session, orcid)
+    if profile is None:
+        profile = get_orcid_profile(session, orcid)
     if not profile:
         return []
     
@@ -442,62 +676,72 @@ def get_arxiv_publications(session, orcid):
         "max_results": 200
     }
     
+    # Atom namespaces used in the arXiv feed
+    ns = {
+        "atom": "http://www.w3.org/2005/Atom",
+        "arxiv": "http://arxiv.org/schemas/atom"
+    }
+    entry_tag = "{http://www.w3.org/2005/Atom}entry"
+    
     try:
-        response = session.get(url, params=params)
-        response.raise_for_status()
-        
-        # arXiv returns XML, we'll need to parse it
-        # Using regex for simplicity (in a production environment, use an XML parser)
-        entries = re.findall(r"<entry>(.*?)</entry>", response.text, re.DOTALL)
-        
         publications = []
-        for entry in entries:
-            # Extract title
-            title_match = re.search(r"<title>(.*?)</title>", entry, re.DOTALL)
-            title = title_match.group(1).strip() if title_match else "Unknown Title"
-            
-            # Extract authors
-            author_matches = re.findall(r"<author><name>(.*?)</name></author>", entry)
-            authors = [author.strip() for author in author_matches]
-            
-            # Extract year
-            published_match = re.search(r"<published>(.*?)</published>", entry)
-            year = None
-            if published_match:
-                published_date = published_match.group(1)
-                year_match = re.search(r"^(\d{4})", published_date)
-                if year_match:
-                    year = int(year_match.group(1))
-            
-            # Extract DOI if present
-            doi = None
-            doi_match = re.search(r"<arxiv:doi>(.*?)</arxiv:doi>", entry)
-            if doi_match:
-                doi = doi_match.group(1).strip()
-            
-            # Extract abstract
-            abstract_match = re.search(r"<summary>(.*?)</summary>", entry, re.DOTALL)
-            abstract = abstract_match.group(1).strip() if abstract_match else None
+        with session.get(url, params=params, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
             
-            # Extract URL
-            url_match = re.search(r"<id>(.*?)</id>", entry)
-            url = url_match.group(1).strip() if url_match else None
-            
-            # Create publication object
-            pub = Publication(
-                title=title,
-                authors=authors,
-                year=year,
-                doi=doi,
-                abstract=abstract,
-                url=url,
-                journal="arXiv",
-                source="arXiv"
-            )
-            publications.append(pub)
+            # Parse entries as the feed streams in and drop each one once consumed
+            for _, entry in ET.iterparse(response.raw, events=("end",)):
+                if entry.tag != entry_tag:
+                    continue
+                
+                # Extract title
+                title = entry.findtext("atom:title", "", ns).strip() or "Unknown Title"
+                
+                # Extract authors
+                authors = [
+                    name.text.strip()
+                    for name in entry.findall("atom:author/atom:name", ns)
+                    if name.text
+                ]
+                
+                # Extract year
+                year = None
+                published = entry.findtext("atom:published", "", ns)
+                if published[:4].isdigit():
+                    year = int(published[:4])
+                
+                # Extract DOI if present
+                doi = entry.findtext("arxiv:doi", None, ns)
+                if doi:
+                    doi = doi.strip()
+                
+                # Extract abstract
+                abstract = entry.findtext("atom:summary", None, ns)
+                if abstract is not None:
+                    abstract = abstract.strip()
+                
+                # Extract URL
+                entry_url = entry.findtext("atom:id", None, ns)
+                if entry_url is not None:
+                    entry_url = entry_url.strip()
+                
+                entry.clear()
+                
+                # Create publication object
+                pub = Publication(
+                    title=title,
+                    authors=authors,
+                    year=year,
+                    doi=doi,
+                    abstract=abstract,
+                    url=entry_url,
+                    journal="arXiv",
+                    source="arXiv"
+                )
+                publications.append(pub)
         
         return publications
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ET.ParseError) as e:
         print(f"Error retrieving arXiv publications: {e}", file=sys.stderr)
         return []
 
@@ -525,7 +769,7 @@ def get_core_publications(session, orcid):
     try:
         response = session.post(url, headers=headers, json=payload)
         response.raise_for_status()
-        data = response.json()
+        data = decode_json(response)
         
         publications = []
         for item in data.get("results", []):
@@ -566,8 +810,85 @@ def get_core_publications(session, orcid):
 
 # ----- Scopus API -----
 
+_COVER_YEAR_RE = re.compile(r"^(\d{4})")
+
+
+# Scopus allows only a few requests per second, so bound the parallel page fetches
+SCOPUS_MAX_CONCURRENCY = 6
+
+
+def parse_scopus_entry(entry):
+    """Build a Publication from one Scopus search result entry"""
+    # Extract title (with error handling)
+    title = entry.get("dc:title", "Unknown Title")
+    
+    # Extract authors (with error handling)
+    authors = []
+    if "author" in entry:
+        if isinstance(entry["author"], list):
+            for author in entry["author"]:
+                if isinstance(author, dict):
+                    if "authname" in author:
+                        authors.append(author["authname"])
+                    elif "given-name" in author and "surname" in author:
+                        authors.append(f"{author['given-name']} {author['surname']}")
+        elif isinstance(entry["author"], dict):  # Handle single author case
+            if "authname" in entry["author"]:
+                authors.append(entry["author"]["authname"])
+            elif "given-name" in entry["author"] and "surname" in entry["author"]:
+                authors.append(f"{entry['author']['given-name']} {entry['author']['surname']}")
+    
+    # Extract year (with error handling)
+    year = None
+    if "prism:coverDate" in entry and entry["prism:coverDate"]:
+        year_match = _COVER_YEAR_RE.match(entry["prism:coverDate"])
+        if year_match:
+            year = int(year_match.group(1))
+    
+    # Extract DOI (with error handling)
+    doi = entry.get("prism:doi")
+    
+    # Extract journal/source (with error handling)
+    journal = entry.get("prism:publicationName")
+    
+    # Extract volume, issue, pages (with error handling)
+    volume = entry.get("prism:volume")
+    issue = entry.get("prism:issueIdentifier")
+    pages = entry.get("prism:pageRange")
+    
+    # Extract citations if available
+    citations = None
+    if "citedby-count" in entry:
+        try:
+            citations = int(entry["citedby-count"])
+        except (ValueError, TypeError):
+            pass
+    
+    # Create publication object
+    pub = Publication(
+        title=title,
+        authors=authors,
+        year=year,
+        doi=doi,
+        journal=journal,
+        volume=volume,
+        issue=issue,
+        pages=pages,
+        url=None,  # URL omitted in simplified view
+        abstract=None,  # Abstract omitted in simplified view
+        citations=citations,
+        source="Scopus"
+    )
+    return pub
+
+
 def get_scopus_publications(session, orcid):
-    """Retrieve publications from Scopus using ORCID with pagination"""
+    """
+    Retrieve publications from Scopus using ORCID with pagination
+    
+    The first page reports the total number of results; the remaining pages are
+    then requested concurrently, a few at a time.
+    """
     # Scopus API requires an API key
     # Register at https://dev.elsevier.com and subscribe to Scopus APIs
     API_KEY = "YOUR_SCOPUS_API_KEY"  # Replace with your Scopus API key
@@ -591,157 +912,99 @@ def get_scopus_publications(session, orcid):
     # But implement pagination to get all results
     count_per_page = 25
     
-    publications = []
-    start_index = 0
-    total_results = None
+    def fetch_page(start_index):
+        """Fetch one page of results; returns the parsed search results"""
+        params = {
+            "query": f"ORCID({formatted_orcid})",
+            "count": count_per_page,
+            "start": start_index,
+            "view": "STANDARD"
+        }
+        response = session.get(url, headers=headers, params=params)
+        response.raise_for_status()
+        # Pace by the quota Scopus reports rather than a fixed delay
+        wait_for_rate_limit(response)
+        return decode_json(response).get("search-results", {})
     
     print("Retrieving Scopus publications with pagination...")
     
-    while True:
-        # Set up parameters for this batch
+    try:
+        # Probe with the first page to learn the total number of results
         params = {
             "query": f"ORCID({formatted_orcid})",
             "count": count_per_page,
-            "start": start_index,
+            "start": 0,
             "view": "STANDARD"
         }
+        response = session.get(url, headers=headers, params=params)
         
-        try:
-            # Get this batch of results
+        if response.status_code != 200:
+            print(f"Scopus API returned status code: {response.status_code}", file=sys.stderr)
+            error_text = response.text[:500] if response.text else "No detailed error message"
+            print(f"Response text: {error_text}", file=sys.stderr)
+            
+            # If the first request failed, try alternative approach (single page only)
+            print("Trying alternative approach with Scopus Search API...", file=sys.stderr)
+            params = {
+                "query": f"ORCID({formatted_orcid})",
+                "count": 10,
+                "field": "dc:title,dc:creator,prism:publicationName,prism:coverDate,prism:doi"
+            }
             response = session.get(url, headers=headers, params=params)
             
             if response.status_code != 200:
-                print(f"Scopus API returned status code: {response.status_code}", file=sys.stderr)
-                error_text = response.text[:500] if response.text else "No detailed error message"
-                print(f"Response text: {error_text}", file=sys.stderr)
-                
-                # If this is the first request and it failed, try alternative approach
-                if start_index == 0:
-                    print("Trying alternative approach with Scopus Search API...", file=sys.stderr)
-                    params = {
-                        "query": f"ORCID({formatted_orcid})",
-                        "count": 10,
-                        "field": "dc:title,dc:creator,prism:publicationName,prism:coverDate,prism:doi"
-                    }
-                    response = session.get(url, headers=headers, params=params)
-                    
-                    if response.status_code != 200:
-                        print(f"Alternative Scopus approach also failed: {response.status_code}", file=sys.stderr)
-                        return []
-                else:
-                    # If a pagination request fails, return what we have so far
-                    print(f"Pagination request failed. Returning {len(publications)} publications found so far.", file=sys.stderr)
-                    return publications
-            
-            data = response.json()
-            search_results = data.get("search-results", {})
-            
-            # Extract total results count if this is the first request
-            if total_results is None:
-                total_count_entry = next((item for item in search_results.get("opensearch:totalResults", []) 
-                                        if isinstance(item, dict) and "@value" in item), None)
-                
-                if total_count_entry:
-                    total_results = int(total_count_entry["@value"])
-                else:
-                    try:
-                        # Try direct value if not a list of dictionaries
-                        total_results_str = search_results.get("opensearch:totalResults", "0")
-                        total_results = int(total_results_str)
-                    except (ValueError, TypeError):
-                        total_results = 0
-                
-                print(f"Total publications in Scopus: {total_results}")
-            
-            # Process the results from this batch
-            entries = search_results.get("entry", [])
+                print(f"Alternative Scopus approach also failed: {response.status_code}", file=sys.stderr)
+                return []
             
-            batch_pubs = []
-            for entry in entries:
-                # Extract title (with error handling)
-                title = entry.get("dc:title", "Unknown Title")
-                
-                # Extract authors (with error handling)
-                authors = []
-                if "author" in entry:
-                    if isinstance(entry["author"], list):
-                        for author in entry["author"]:
-                            if isinstance(author, dict):
-                                if "authname" in author:
-                                    authors.append(author["authname"])
-                                elif "given-name" in author and "surname" in author:
-                                    authors.append(f"{author['given-name']} {author['surname']}")
-                    elif isinstance(entry["author"], dict):  # Handle single author case
-                        if "authname" in entry["author"]:
-                            authors.append(entry["author"]["authname"])
-                        elif "given-name" in entry["author"] and "surname" in entry["author"]:
-                            authors.append(f"{entry['author']['given-name']} {entry['author']['surname']}")
-                
-                # Extract year (with error handling)
-                year = None
-                if "prism:coverDate" in entry and entry["prism:coverDate"]:
-                    year_match = re.search(r"^(\d{4})", entry["prism:coverDate"])
-                    if year_match:
-                        year = int(year_match.group(1))
-                
-                # Extract DOI (with error handling)
-                doi = entry.get("prism:doi")
-                
-                # Extract journal/source (with error handling)
-                journal = entry.get("prism:publicationName")
-                
-                # Extract volume, issue, pages (with error handling)
-                volume = entry.get("prism:volume")
-                issue = entry.get("prism:issueIdentifier")
-                pages = entry.get("prism:pageRange")
-                
-                # Extract citations if available
-                citations = None
-                if "citedby-count" in entry:
-                    try:
-                        citations = int(entry["citedby-count"])
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Create publication object
-                pub = Publication(
-                    title=title,
-                    authors=authors,
-                    year=year,
-                    doi=doi,
-                    journal=journal,
-                    volume=volume,
-                    issue=issue,
-                    pages=pages,
-                    url=None,  # URL omitted in simplified view
-                    abstract=None,  # Abstract omitted in simplified view
-                    citations=citations,
-                    source="Scopus"
-                )
-                batch_pubs.append(pub)
-            
-            # Add this batch to our collection
-            publications.extend(batch_pubs)
-            print(f"Retrieved {len(batch_pubs)} Scopus publications (batch starting at {start_index})")
-            
-            # Check if we need to continue pagination
-            if total_results is not None and len(publications) >= total_results:
-                break
-                
-            # If we didn't get a full page, we're likely at the end
-            if len(batch_pubs) < count_per_page:
-                break
-                
-            # Increment start index for next batch
-            start_index += count_per_page
-            
-            # Add a small delay to avoid rate limiting
-            time.sleep(0.5)
-            
-        except requests.exceptions.RequestException as e:
-            print(f"Error retrieving Scopus publications: {e}", file=sys.stderr)
-            # Return what we have so far
+            entries = decode_json(response).get("search-results", {}).get("entry", [])
+            publications = [parse_scopus_entry(entry) for entry in entries]
+            print(f"Completed Scopus retrieval. Found {len(publications)} publications.")
             return publications
+        
+        wait_for_rate_limit(response)
+        search_results = decode_json(response).get("search-results", {})
+        
+        # Extract total results count
+        total_count_entry = next((item for item in search_results.get("opensearch:totalResults", []) 
+                                if isinstance(item, dict) and "@value" in item), None)
+        
+        if total_count_entry:
+            total_results = int(total_count_entry["@value"])
+        else:
+            try:
+                # Try direct value if not a list of dictionaries
+                total_results_str = search_results.get("opensearch:totalResults", "0")
+                total_results = int(total_results_str)
+            except (ValueError, TypeError):
+                total_results = 0
+        
+        print(f"Total publications in Scopus: {total_results}")
+        
+        publications = [parse_scopus_entry(entry) for entry in search_results.get("entry", [])]
+        print(f"Retrieved {len(publications)} Scopus publications (batch starting at 0)")
+    except requests.exceptions.RequestException as e:
+        print(f"Error retrieving Scopus publications: {e}", file=sys.stderr)
+        return []
+    
+    # Fetch the remaining pages concurrently; results are consumed in page order
+    start_indices = list(range(count_per_page, total_results, count_per_page))
+    if start_indices and len(publications) == count_per_page:
+        with ThreadPoolExecutor(max_workers=SCOPUS_MAX_CONCURRENCY) as executor:
+            pages = [(start, executor.submit(fetch_page, start)) for start in start_indices]
+            for start_index, future in pages:
+                try:
+                    entries = future.result().get("entry", [])
+                except requests.exceptions.RequestException as e:
+                    # If a pagination request fails, keep the pages retrieved so far
+                    print(f"Error retrieving Scopus publications: {e}", file=sys.stderr)
+                    print(f"Pagination request failed. Returning {len(publications)} publications found so far.", file=sys.stderr)
+                    for _, pending in pages:
+                        pending.cancel()
+                    break
+                
+                batch_pubs = [parse_scopus_entry(entry) for entry in entries]
+                publications.extend(batch_pubs)
+                print(f"Retrieved {len(batch_pubs)} Scopus publications (batch starting at {start_index})")
     
     print(f"Completed Scopus retrieval. Found {len(publications)} publications.")
     return publications
@@ -749,6 +1012,9 @@ def get_scopus_publications(session, orcid):
 
 # ----- DBLP API (for Computer Science) -----
 
+_DOI_URL_RE = re.compile(r"https?://(?:dx\.)?doi\.org/(.+)")
+
+
 def get_dblp_publications(session, orcid):
     """Retrieve publications from DBLP using ORCID"""
     # First, get the DBLP author ID using ORCID
@@ -757,7 +1023,7 @@ def get_dblp_publications(session, orcid):
     try:
         response = session.get(url)
         response.raise_for_status()
-        data = response.json()
+        data = decode_json(response)
         
         authors = data.get("result", {}).get("hits", {}).get("hit", [])
         if not authors:
@@ -770,62 +1036,63 @@ def get_dblp_publications(session, orcid):
         
         # Now get publications for this author
         pub_url = f"https://dblp.org/pid/{author_key}.xml"
-        response = session.get(pub_url)
-        response.raise_for_status()
-        
-        # DBLP returns XML, we'll need to parse it
-        # Using regex for simplicity (in a production environment, use an XML parser)
         publications = []
         
         # Extract different types of publications (articles, inproceedings, etc.)
-        publication_types = [
-            "article", "inproceedings", "proceedings", "book", 
+        publication_types = {
+            "article", "inproceedings", "proceedings", "book",
             "incollection", "phdthesis", "mastersthesis"
-        ]
+        }
         
-        for pub_type in publication_types:
-            pattern = f"<{pub_type}[^>]*>(.*?)</{pub_type}>"
-            entries = re.findall(pattern, response.text, re.DOTALL)
+        with session.get(pub_url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
             
-            for entry in entries:
-                # Extract title
-                title_match = re.search(r"<title>(.*?)</title>", entry, re.DOTALL)
-                title = title_match.group(1).strip() if title_match else "Unknown Title"
+            # Parse records as the document streams in and drop each one once consumed
+            for _, entry in ET.iterparse(response.raw, events=("end",)):
+                pub_type = entry.tag
+                if pub_type not in publication_types:
+                    continue
+                
+                # Extract title (may contain inline markup such as <i> or <sub>)
+                title_elem = entry.find("title")
+                title = "Unknown Title"
+                if title_elem is not None:
+                    title = "".join(title_elem.itertext()).strip() or title
                 
                 # Extract authors
-                author_matches = re.findall(r"<author>(.*?)</author>", entry)
-                authors = [author.strip() for author in author_matches]
+                authors = [
+                    "".join(author.itertext()).strip()
+                    for author in entry.findall("author")
+                ]
                 
                 # Extract year
-                year_match = re.search(r"<year>(.*?)</year>", entry)
-                year = int(year_match.group(1)) if year_match else None
+                year_text = entry.findtext("year")
+                year = int(year_text) if year_text and year_text.isdigit() else None
                 
-                # Extract DOI if present
-                doi_match = re.search(r"<ee>https?://doi.org/(.*?)</ee>", entry)
-                doi = doi_match.group(1) if doi_match else None
+                # Extract electronic editions: the first is the URL, the first doi.org one the DOI
+                links = [ee.text.strip() for ee in entry.findall("ee") if ee.text]
+                url = links[0] if links else None
+                doi = None
+                for link in links:
+                    match = _DOI_URL_RE.match(link)
+                    if match:
+                        doi = match.group(1)
+                        break
                 
                 # Extract venue/journal
                 journal = None
                 if pub_type == "article":
-                    journal_match = re.search(r"<journal>(.*?)</journal>", entry)
-                    journal = journal_match.group(1) if journal_match else None
+                    journal = entry.findtext("journal")
                 elif pub_type == "inproceedings":
-                    booktitle_match = re.search(r"<booktitle>(.*?)</booktitle>", entry)
-                    journal = booktitle_match.group(1) if booktitle_match else None
-                
-                # Extract URL
-                url_match = re.search(r"<ee>(.*?)</ee>", entry)
-                url = url_match.group(1) if url_match else None
+                    journal = entry.findtext("booktitle")
                 
                 # Extract volume, number, pages
-                volume_match = re.search(r"<volume>(.*?)</volume>", entry)
-                volume = volume_match.group(1) if volume_match else None
+                volume = entry.findtext("volume")
+                issue = entry.findtext("number")
+                pages = entry.findtext("pages")
                 
-                number_match = re.search(r"<number>(.*?)</number>", entry)
-                issue = number_match.group(1) if number_match else None
-                
-                pages_match = re.search(r"<pages>(.*?)</pages>", entry)
-                pages = pages_match.group(1) if pages_match else None
+                entry.clear()
                 
                 # Create publication object
                 pub = Publication(
@@ -844,87 +1111,224 @@ def get_dblp_publications(session, orcid):
                 publications.append(pub)
         
         return publications
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, ET.ParseError) as e:
         print(f"Error retrieving DBLP publications: {e}", file=sys.stderr)
         return []
 
 
 # ----- Data Consolidation -----
 
+_DOI_PREFIX_RE = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:)")
+PUNCTUATION_TO_SPACE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+# Minimum similarity for two DOI-less records with the same year to count as one
+TITLE_MATCH_THRESHOLD = 0.95
+
+
+def normalize_doi(doi):
+    """Canonical DOI for comparisons: lowercase, without resolver or doi: prefix"""
+    if not doi:
+        return None
+    return _DOI_PREFIX_RE.sub("", doi.strip().lower(), count=1) or None
+
+
+def normalize_title(title):
+    """
+    Canonical title for comparisons: accents folded, case folded, punctuation removed
+
+    Only combining marks are dropped after decomposition, so titles in non-Latin
+    scripts keep their letters rather than collapsing to an empty key.
+    """
+    decomposed = unicodedata.normalize("NFKD", title or "")
+    folded = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(folded.casefold().translate(PUNCTUATION_TO_SPACE).split())
+
+
+def token_jaccard(tokens, other_tokens):
+    """Jaccard similarity of two token sets (1.0 for identical sets, in any order)"""
+    if not tokens or not other_tokens:
+        return 0.0
+    shared = len(tokens & other_tokens)
+    return shared / (len(tokens) + len(other_tokens) - shared)
+
+
+def name_tokens(pub):
+    """Name parts (surnames and given names) of all authors, for matching across sources"""
+    return {
+        token
+        for author in pub.authors
+        for token in normalize_title(author).split()
+        if len(token) > 1
+    }
+
+
+# Fields a duplicate record can fill in when they are missing from the kept one
+MERGE_FIELDS = (
+    "authors", "journal", "abstract", "url", "volume",
+    "issue", "pages", "publisher", "citations", "type"
+)
+
+
+def merge_into(existing, pub):
+    """Fold the information of a duplicate record into an existing one"""
+    # Update source to show where info came from
+    existing.source = f"{existing.source}, {pub.source}"
+    
+    # Nothing left to fill in once the record is complete
+    if existing._complete:
+        return
+    
+    # Update fields if they're missing in the existing record
+    complete = True
+    for name in MERGE_FIELDS:
+        if not getattr(existing, name):
+            value = getattr(pub, name)
+            if value:
+                setattr(existing, name, value)
+            else:
+                complete = False
+    existing._complete = complete
+
+
 def merge_publications(publications_list):
-    """Merge and deduplicate publications from different sources"""
-    merged = {}  # Use DOI or title+year as key
+    """
+    Merge and deduplicate publications from different sources
+    
+    Records are first collapsed by normalized DOI in a single hash pass. Only the
+    DOI-less remainder is then compared by title, and only against records from
+    the same year whose authors share a name (records without authors match any).
+    A DOI-less record is thereby folded into its DOI-bearing counterpart whichever
+    of the two a provider returned first, so the merged record keeps the DOI.
+    """
+    merged = []
+    by_doi = {}
+    residual = []
     
     for pub in publications_list:
-        key = pub.doi.lower() if pub.doi else f"{pub.title.lower()}_{pub.year}"
+        doi_key = pub._doi_key
+        if doi_key is None:
+            residual.append(pub)
+        elif doi_key in by_doi:
+            merge_into(by_doi[doi_key], pub)
+        else:
+            by_doi[doi_key] = pub
+            merged.append(pub)
+    
+    # Candidates for title matching as (insertion order, normalized title, title
+    # words, names, record): indexed by exact (title, year) for the common case of
+    # identical titles, and bucketed by (year, name token) for the similarity scan
+    # so that a record is only compared with those sharing an author name. Records
+    # without authors go in a (year, None) bucket; by_year is kept for residual
+    # records without authors, which may match any record of their year. Records
+    # without a usable title are never candidates, as nothing identifies them.
+    by_title_year = {}
+    by_year_name = {}
+    by_year = {}
+    order = count()
+    
+    def add_candidate(pub, names):
+        if not pub._title_key:
+            return
+        candidate = (next(order), pub._title_key, frozenset(pub._title_key.split()), names, pub)
+        by_title_year.setdefault((pub._title_key, pub.year), []).append(candidate)
+        by_year.setdefault(pub.year, []).append(candidate)
+        for token in names or (None,):
+            by_year_name.setdefault((pub.year, token), []).append(candidate)
+    
+    for pub in merged:
+        add_candidate(pub, name_tokens(pub))
+    
+    for pub in residual:
+        title = pub._title_key
+        if not title:
+            merged.append(pub)
+            continue
+        names = name_tokens(pub)
+        
+        existing = next(
+            (other for _, _, _, other_names, other in by_title_year.get((title, pub.year), ())
+             if not names or not other_names or names & other_names),
+            None
+        )
+        if existing is not None:
+            merge_into(existing, pub)
+            continue
         
-        if key not in merged:
-            merged[key] = pub
+        # Word sets are compared first: set operations are cheap and catch titles
+        # with the same words in a different order, which character matching
+        # misses. SequenceMatcher caches its analysis of the second sequence, so
+        # the residual title is fixed there and only candidates are swapped in;
+        # the cheap upper bounds reject most before the full ratio is computed.
+        if names:
+            # Gather the buckets of each name plus the author-less one, in the
+            # order the candidates were added so that the first match still wins
+            candidates = {
+                candidate[0]: candidate
+                for key in [(pub.year, token) for token in names] + [(pub.year, None)]
+                for candidate in by_year_name.get(key, ())
+            }
+            candidates = [candidates[index] for index in sorted(candidates)]
         else:
-            # Merge information, preferring non-None values
-            existing = merged[key]
-            
-            # Update source to show where info came from
-            existing.source = f"{existing.source}, {pub.source}"
-            
-            # Update fields if they're missing in the existing record
-            if not existing.authors and pub.authors:
-                existing.authors = pub.authors
-            
-            if not existing.journal and pub.journal:
-                existing.journal = pub.journal
-                
-            if not existing.abstract and pub.abstract:
-                existing.abstract = pub.abstract
-                
-            if not existing.url and pub.url:
-                existing.url = pub.url
-                
-            if not existing.volume and pub.volume:
-                existing.volume = pub.volume
-                
-            if not existing.issue and pub.issue:
-                existing.issue = pub.issue
-                
-            if not existing.pages and pub.pages:
-                existing.pages = pub.pages
-                
-            if not existing.publisher and pub.publisher:
-                existing.publisher = pub.publisher
-                
-            if not existing.citations and pub.citations:
-                existing.citations = pub.citations
-                
-            if not existing.type and pub.type:
-                existing.type = pub.type
+            candidates = by_year.get(pub.year, ())
+        
+        words = frozenset(title.split())
+        matcher = SequenceMatcher(None, "", title)
+        for _, other_title, other_words, _, existing in candidates:
+            if title == other_title:
+                continue
+            if token_jaccard(words, other_words) < TITLE_MATCH_THRESHOLD:
+                matcher.set_seq1(other_title)
+                if (matcher.real_quick_ratio() < TITLE_MATCH_THRESHOLD
+                        or matcher.quick_ratio() < TITLE_MATCH_THRESHOLD
+                        or matcher.ratio() < TITLE_MATCH_THRESHOLD):
+                    continue
+            merge_into(existing, pub)
+            break
+        else:
+            add_candidate(pub, names)
+            merged.append(pub)
     
-    return list(merged.values())
+    return merged
+
+
+def intern_strings(publications):
+    """
+    Share one string object per distinct author, journal and publisher name
+    
+    Co-authors and venues repeat across many records, and every provider
+    decodes its own copy of each name; pooling them keeps a single copy.
+    """
+    pool = {}
+    intern = pool.setdefault
+    for pub in publications:
+        pub.authors = [intern(name, name) for name in map(str.strip, pub.authors)]
+        if pub.journal:
+            pub.journal = intern(pub.journal, pub.journal)
+        if pub.publisher:
+            pub.publisher = intern(pub.publisher, pub.publisher)
+    return publications
+
+
+def format_authors(authors):
+    """Short author list for citations: one name, two names, or first name et al."""
+    if len(authors) == 1:
+        return authors[0]
+    if len(authors) == 2:
+        return f"{authors[0]} and {authors[1]}"
+    return f"{authors[0]} et al." if authors else ""
 
 
 def format_citation(pub):
     """Format a publication as a citation string"""
-    # Format authors
-    author_str = ""
-    if pub.authors:
-        if len(pub.authors) == 1:
-            author_str = pub.authors[0]
-        elif len(pub.authors) == 2:
-            author_str = f"{pub.authors[0]} and {pub.authors[1]}"
-        else:
-            author_str = f"{pub.authors[0]} et al."
-    
-    # Year
-    year_str = f" ({pub.year})" if pub.year else ""
-    
-    # Title
-    title_str = f". {pub.title}"
+    # Authors, year and title
+    parts = [format_authors(pub.authors)]
+    if pub.year:
+        parts.append(f" ({pub.year})")
+    parts.append(f". {pub.title}")
     
-    # Journal and publication details
-    journal_str = ""
+    # Journal and publication details (volume, issue, pages if available)
     if pub.journal:
-        journal_str = f". {pub.journal}"
-        
-        # Add volume, issue, pages if available
+        parts.append(f". {pub.journal}")
         details = []
         if pub.volume:
             details.append(f"vol. {pub.volume}")
@@ -932,49 +1336,96 @@ def format_citation(pub):
             details.append(f"no. {pub.issue}")
         if pub.pages:
             details.append(f"pp. {pub.pages}")
-        
         if details:
-            journal_str += f", {', '.join(details)}"
-    
-    # DOI
-    doi_str = f". DOI: {pub.doi}" if pub.doi else ""
+            parts.append(", ")
+            parts.append(", ".join(details))
     
-    # Citations
-    citation_str = f". Citations: {pub.citations}" if pub.citations is not None else ""
+    # DOI and citations
+    if pub.doi:
+        parts.append(f". DOI: {pub.doi}")
+    if pub.citations is not None:
+        parts.append(f". Citations: {pub.citations}")
     
-    return f"{author_str}{year_str}{title_str}{journal_str}{doi_str}{citation_str}"
+    return "".join(parts)
+
+
+# Output files are written through a large buffer instead of many small writes
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+# Citations are written to text output in batches of this many records
+TEXT_BATCH_SIZE = 64
+
+
+def save_to_text(publications, out):
+    """Write numbered citations to an open text stream, a batch of records per write"""
+    batch = []
+    for i, pub in enumerate(publications, 1):
+        batch.append(f"{i}. {format_citation(pub)}\n\n")
+        if len(batch) == TEXT_BATCH_SIZE:
+            out.write("".join(batch))
+            batch.clear()
+    out.write("".join(batch))
 
 
 def save_to_json(publications, filename):
     """Save publications to a JSON file"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        # Convert Publications to dictionaries
-        pubs_dict = [vars(pub) for pub in publications]
-        json.dump(pubs_dict, f, indent=2, ensure_ascii=False)
+    with open(filename, 'wb') as f:
+        # orjson serializes dataclasses natively, without building intermediate
+        # dictionaries, and leaves out the underscore-prefixed internal keys
+        f.write(orjson.dumps(list(publications), option=orjson.OPT_INDENT_2))
+
+
+def save_to_jsonl(publications, filename):
+    """Save publications as JSON Lines, serializing one record at a time"""
+    with open(filename, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        for pub in publications:
+            f.write(orjson.dumps(pub, option=orjson.OPT_APPEND_NEWLINE))
 
 
 def save_to_csv(publications, filename):
     """Save publications to a CSV file"""
     import csv
     
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
         fieldnames = [
             'title', 'authors', 'year', 'journal', 'volume', 'issue', 
             'pages', 'doi', 'url', 'citations', 'type', 'source'
         ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.writer(f)
         
-        writer.writeheader()
-        for pub in publications:
-            # Convert Publication to dict, with special handling for authors list
-            pub_dict = vars(pub).copy()
-            pub_dict['authors'] = '; '.join(pub.authors) if pub.authors else ''
-            writer.writerow(pub_dict)
+        writer.writerow(fieldnames)
+        # Rows are built lazily as plain tuples, with special handling for the
+        # authors list, and handed to the writer in one call
+        writer.writerows(
+            tuple('; '.join(pub.authors) if name == 'authors' else getattr(pub, name) for name in fieldnames)
+            for pub in publications
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def bibtex_entry_type(pub_type):
+    """
+    BibTeX entry type for a provider's publication type
+    
+    Providers use a handful of distinct type strings, so the mapping is memoized
+    and each one is lowercased and scanned only once per run.
+    """
+    if not pub_type:
+        return "article"
+    pub_type = pub_type.lower()
+    if "conference" in pub_type or "proceedings" in pub_type:
+        return "inproceedings"
+    if "book" in pub_type:
+        return "book"
+    if "thesis" in pub_type:
+        return "phdthesis" if "phd" in pub_type else "mastersthesis"
+    return "article"
 
 
 def save_to_bibtex(publications, filename):
     """Save publications to a BibTeX file"""
-    with open(filename, 'w', encoding='utf-8') as f:
+    with open(filename, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
         for i, pub in enumerate(publications):
             # Generate citation key
             first_author = ""
@@ -984,150 +1435,142 @@ def save_to_bibtex(publications, filename):
             citation_key = f"{first_author}{pub.year}{i}"
             
             # Determine entry type
-            entry_type = "article"
-            if pub.type:
-                if "conference" in pub.type.lower() or "proceedings" in pub.type.lower():
-                    entry_type = "inproceedings"
-                elif "book" in pub.type.lower():
-                    entry_type = "book"
-                elif "thesis" in pub.type.lower():
-                    if "phd" in pub.type.lower():
-                        entry_type = "phdthesis"
-                    else:
-                        entry_type = "mastersthesis"
+            entry_type = bibtex_entry_type(pub.type)
             
-            # Start entry
-            f.write(f"@{entry_type}{{{citation_key},\n")
+            # Start entry; the entry is assembled in full and written at once
+            lines = [f"@{entry_type}{{{citation_key},\n"]
             
             # Write fields
             if pub.authors:
                 authors_bibtex = " and ".join(pub.authors)
-                f.write(f"  author = {{{authors_bibtex}}},\n")
+                lines.append(f"  author = {{{authors_bibtex}}},\n")
             
-            f.write(f"  title = {{{pub.title}}},\n")
+            lines.append(f"  title = {{{pub.title}}},\n")
             
             if pub.year:
-                f.write(f"  year = {{{pub.year}}},\n")
+                lines.append(f"  year = {{{pub.year}}},\n")
             
             if pub.journal:
                 journal_field = "journal" if entry_type == "article" else "booktitle"
-                f.write(f"  {journal_field} = {{{pub.journal}}},\n")
+                lines.append(f"  {journal_field} = {{{pub.journal}}},\n")
             
             if pub.volume:
-                f.write(f"  volume = {{{pub.volume}}},\n")
+                lines.append(f"  volume = {{{pub.volume}}},\n")
             
             if pub.issue:
-                f.write(f"  number = {{{pub.issue}}},\n")
+                lines.append(f"  number = {{{pub.issue}}},\n")
             
             if pub.pages:
-                f.write(f"  pages = {{{pub.pages}}},\n")
+                lines.append(f"  pages = {{{pub.pages}}},\n")
             
             if pub.publisher:
-                f.write(f"  publisher = {{{pub.publisher}}},\n")
+                lines.append(f"  publisher = {{{pub.publisher}}},\n")
             
             if pub.doi:
-                f.write(f"  doi = {{{pub.doi}}},\n")
+                lines.append(f"  doi = {{{pub.doi}}},\n")
             
             if pub.url:
-                f.write(f"  url = {{{pub.url}}},\n")
+                lines.append(f"  url = {{{pub.url}}},\n")
             
             # Close entry
-            f.write("}\n\n")
+            lines.append("}\n\n")
+            f.write("".join(lines))
 
 
 # ----- Main Function -----
 
-def main():
-    """Main function"""
-    parser = argparse.ArgumentParser(description="Retrieve academic publications using an ORCID ID")
-    parser.add_argument("orcid", help="ORCID ID (format: XXXX-XXXX-XXXX-XXXX)")
-    parser.add_argument("-o", "--output", help="Output format: text, json, csv, bibtex (default: text)")
-    parser.add_argument("-f", "--file", help="Output file (default: publications_<orcid>.<format>)")
-    parser.add_argument("-s", "--sort", help="Sort by: year, title, citations (default: year)")
-    parser.add_argument("-r", "--reverse", action="store_true", help="Reverse sort order")
-    args = parser.parse_args()
+# Providers are I/O bound, so one worker per provider keeps them all in flight
+MAX_PROVIDER_WORKERS = 8
+
+_ORCID_RE = re.compile(r"^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$")
+
+
+def collect_publications(session, orcid, crossref_pubs=None):
+    """
+    Query all databases for one ORCID and return the merged publications
     
-    # Validate ORCID format
-    orcid_pattern = r"^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$"
-    if not re.match(orcid_pattern, args.orcid):
-        print("Invalid ORCID format. Expected: XXXX-XXXX-XXXX-XXXX", file=sys.stderr)
-        return 1
+    crossref_pubs are the author's Crossref works if already retrieved as part
+    of a batch; Crossref is queried for this ORCID alone otherwise.
+    """
+    print(f"Retrieving publications for ORCID: {orcid}")
     
-    print(f"Retrieving publications for ORCID: {args.orcid}")
+    if crossref_pubs is None:
+        crossref = get_crossref_publications
+    else:
+        def crossref(session, orcid):
+            return crossref_pubs
     
-    # Create session
-    session = create_session()
+    def semantic_scholar(session, orcid):
+        # Only the name search fallback needs the profile, so hand over the
+        # in-flight future rather than waiting on it or fetching it again
+        return get_semantic_scholar_works(session, orcid, orcid_profile=profile_future)
     
-    # Get author info from ORCID
-    profile = get_orcid_profile(session, args.orcid)
-    if profile:
-        first_name = profile.get("person", {}).get("name", {}).get("given-names", {}).get("value", "")
-        last_name = profile.get("person", {}).get("name", {}).get("family-name", {}).get("value", "")
-        print(f"Author: {first_name} {last_name}")
+    def arxiv(session, orcid):
+        # arXiv searches by name, so it is the one provider that waits for the profile
+        return get_arxiv_publications(session, orcid, profile=profile_future.result())
     
     # Collect publications from various sources
-    print("Querying databases...")
-    
-    all_publications = []
-    
-    # ORCID Works
-    print("Querying ORCID...")
-    orcid_pubs = get_orcid_works(session, args.orcid)
-    print(f"  Found {len(orcid_pubs)} publications")
-    all_publications.extend(orcid_pubs)
-    
-    # Crossref
-    print("Querying Crossref...")
-    crossref_pubs = get_crossref_publications(session, args.orcid)
-    print(f"  Found {len(crossref_pubs)} publications")
-    all_publications.extend(crossref_pubs)
-    
-    # Semantic Scholar
-    print("Querying Semantic Scholar...")
-    ss_profile = get_semantic_scholar_profile(session, args.orcid)
-    ss_author_id = ss_profile.get("authorId") if ss_profile else None
-    if ss_author_id:
-        ss_pubs = get_semantic_scholar_publications(session, ss_author_id)
-        print(f"  Found {len(ss_pubs)} publications")
-        all_publications.extend(ss_pubs)
-    else:
-        print("  Author not found in Semantic Scholar")
-    
-    # OpenAlex
-    print("Querying OpenAlex...")
-    openalex_pubs = get_openalex_publications(session, args.orcid)
-    print(f"  Found {len(openalex_pubs)} publications")
-    all_publications.extend(openalex_pubs)
-    
-    # arXiv
-    print("Querying arXiv...")
-    arxiv_pubs = get_arxiv_publications(session, args.orcid)
-    print(f"  Found {len(arxiv_pubs)} publications")
-    all_publications.extend(arxiv_pubs)
-    
-    # DBLP
-    print("Querying DBLP...")
-    dblp_pubs = get_dblp_publications(session, args.orcid)
-    print(f"  Found {len(dblp_pubs)} publications")
-    all_publications.extend(dblp_pubs)
-    
-    # CORE (commented out as it requires an API key)
-    # print("Querying CORE...")
-    # core_pubs = get_core_publications(session, args.orcid)
-    # print(f"  Found {len(core_pubs)} publications")
-    # all_publications.extend(core_pubs)
-    
-    # Scopus (commented out as it requires an API key)
-    print("Querying Scopus...")
-    scopus_pubs = get_scopus_publications(session, args.orcid)
-    print(f"  Found {len(scopus_pubs)} publications")
-    all_publications.extend(scopus_pubs)
+    providers = [
+        ("ORCID", get_orcid_works),
+        ("Crossref", crossref),
+        ("Semantic Scholar", semantic_scholar),
+        ("OpenAlex", get_openalex_publications),
+        ("arXiv", arxiv),
+        ("DBLP", get_dblp_publications),
+        # CORE (commented out as it requires an API key)
+        # ("CORE", get_core_publications),
+        ("Scopus", get_scopus_publications),
+    ]
+    print(f"Querying databases: {', '.join(name for name, _ in providers)}...")
+    
+    results = [None] * len(providers)
+    
+    # Each provider spends its time waiting on the network, so query them all at
+    # once: the total wait is then the slowest provider instead of the sum of all.
+    # The ORCID profile is fetched alongside them rather than before them; it is
+    # submitted first so that it never queues behind a provider waiting on it.
+    with ThreadPoolExecutor(max_workers=MAX_PROVIDER_WORKERS + 1) as executor:
+        profile_future = executor.submit(get_orcid_profile, session, orcid)
+        futures = {
+            executor.submit(fetch, session, orcid): (index, name)
+            for index, (name, fetch) in enumerate(providers)
+        }
+        
+        # Get author info from ORCID
+        profile = profile_future.result()
+        if profile:
+            first_name = profile.get("person", {}).get("name", {}).get("given-names", {}).get("value", "")
+            last_name = profile.get("person", {}).get("name", {}).get("family-name", {}).get("value", "")
+            print(f"Author: {first_name} {last_name}")
+        
+        # Report each provider as soon as it finishes
+        for future in as_completed(futures):
+            index, name = futures[future]
+            try:
+                pubs = future.result()
+            except Exception as e:
+                # One broken provider must not discard the results of the others
+                print(f"  {name}: failed ({e})", file=sys.stderr)
+                continue
+            if pubs is None:
+                print(f"  {name}: author not found")
+            else:
+                print(f"  {name}: found {len(pubs)} publications")
+                results[index] = pubs
+    
+    # Merge in provider order so the preferred record for duplicates is stable
+    all_publications = [pub for pubs in results if pubs for pub in pubs]
     
     # Merge and deduplicate
     print("Merging and deduplicating results...")
-    merged_pubs = merge_publications(all_publications)
+    merged_pubs = intern_strings(merge_publications(all_publications))
     print(f"Final count: {len(merged_pubs)} unique publications")
     
+    return merged_pubs
+
+
+def save_publications(merged_pubs, orcid, args):
+    """Sort the publications of one ORCID and write them in the requested format"""
     # Sort publications
     sort_key = args.sort if args.sort else "year"
     reverse = args.reverse
@@ -1135,7 +1578,8 @@ def main():
     if sort_key == "year":
         merged_pubs.sort(key=lambda x: (x.year if x.year else 0), reverse=reverse)
     elif sort_key == "title":
-        merged_pubs.sort(key=lambda x: x.title.lower(), reverse=reverse)
+        # The key is computed once per record; casefold keeps non-Latin titles in order
+        merged_pubs.sort(key=lambda x: x.title.casefold(), reverse=reverse)
     elif sort_key == "citations":
         merged_pubs.sort(key=lambda x: (x.citations if x.citations else 0), reverse=reverse)
     
@@ -1145,10 +1589,12 @@ def main():
         output_file = args.file
     else:
         # Remove special characters from ORCID for filename
-        orcid_clean = args.orcid.replace("-", "")
+        orcid_clean = orcid.replace("-", "")
         output_file = f"publications_{orcid_clean}"
         if output_format == "json":
             output_file += ".json"
+        elif output_format == "jsonl":
+            output_file += ".jsonl"
         elif output_format == "csv":
             output_file += ".csv"
         elif output_format == "bibtex":
@@ -1160,6 +1606,9 @@ def main():
     if output_format == "json":
         save_to_json(merged_pubs, output_file)
         print(f"Results saved to {output_file}")
+    elif output_format == "jsonl":
+        save_to_jsonl(merged_pubs, output_file)
+        print(f"Results saved to {output_file}")
     elif output_format == "csv":
         save_to_csv(merged_pubs, output_file)
         print(f"Results saved to {output_file}")
@@ -1169,14 +1618,55 @@ def main():
     else:
         # Text output (to file or stdout)
         if output_file == "stdout":
-            for i, pub in enumerate(merged_pubs, 1):
-                print(f"{i}. {format_citation(pub)}")
-                print()
+            save_to_text(merged_pubs, sys.stdout)
+            sys.stdout.flush()
         else:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                for i, pub in enumerate(merged_pubs, 1):
-                    f.write(f"{i}. {format_citation(pub)}\n\n")
+            with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                save_to_text(merged_pubs, f)
             print(f"Results saved to {output_file}")
+
+
+def main():
+    """Main function"""
+    global PROFILE_CACHE_DIR
+    
+    parser = argparse.ArgumentParser(description="Retrieve academic publications using ORCID IDs")
+    parser.add_argument("orcid", nargs="+", help="One or more ORCID IDs (format: XXXX-XXXX-XXXX-XXXX)")
+    parser.add_argument("-o", "--output", help="Output format: text, json, jsonl, csv, bibtex (default: text)")
+    parser.add_argument("-f", "--file",
+                        help="Output file, single ORCID only (default: publications_<orcid>.<format>)")
+    parser.add_argument("-s", "--sort", help="Sort by: year, title, citations (default: year)")
+    parser.add_argument("-r", "--reverse", action="store_true", help="Reverse sort order")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Ignore and do not update the ORCID profile cache in {PROFILE_CACHE_DIR}")
+    args = parser.parse_args()
+    
+    if args.no_cache:
+        PROFILE_CACHE_DIR = None
+    
+    # Validate ORCID format
+    for orcid in args.orcid:
+        if not _ORCID_RE.match(orcid):
+            print(f"Invalid ORCID format: {orcid}. Expected: XXXX-XXXX-XXXX-XXXX", file=sys.stderr)
+            return 1
+    
+    if args.file and args.file != "stdout" and len(args.orcid) > 1:
+        print("An output file can only be given for a single ORCID", file=sys.stderr)
+        return 1
+    
+    # Create session
+    session = create_session()
+    
+    # Crossref accepts several ORCIDs in one filter, so retrieve a group's works
+    # with one paged query instead of one per person
+    crossref_by_orcid = {}
+    if len(args.orcid) > 1:
+        print(f"Retrieving Crossref publications for {len(args.orcid)} ORCIDs...")
+        crossref_by_orcid = get_crossref_publications_batch(session, args.orcid)
+    
+    for orcid in args.orcid:
+        merged_pubs = collect_publications(session, orcid, crossref_by_orcid.get(orcid))
+        save_publications(merged_pubs, orcid, args)
     
     return 0
 